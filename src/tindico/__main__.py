@@ -1,7 +1,15 @@
+import sys
+
+from .config import get_token
 from .tui import IndicoApp
 
 
 def main():
+    try:
+        get_token()
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
     app = IndicoApp()
     app.run()
 
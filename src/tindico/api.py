@@ -1,69 +1,245 @@
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import cache
+from .config import get_base_url, get_token
+from .models import (
+    Contribution,
+    IndicoEvent,
+    _memoized_datetime_parser,
+    _parse_attachments,
+    contribution_from_json,
+    events_from_json_many,
+)
+
+
+@functools.cache
+def _get_session() -> requests.Session:
+    """One keep-alive session for all calls, so only the first request pays the TLS handshake."""
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {get_token()}"
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                # Hand the final response back so raise_for_status() still raises HTTPError
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+# Shared pool for overlapping independent requests (e.g. timetable + contributions)
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tindico-api")
+
+# Seconds a cached response stays fresh, by endpoint prefix (first match wins).
+# Endpoints not listed here are never cached.
+_CACHE_TTL = (
+    ("/export/categ/favorites", 60),
+    ("/export/timetable/", 300),
+    ("/export/event/", 300),
+    ("/export/categ/", 300),
+)
+# Endpoints whose stale cached body is returned immediately and refreshed in the background
+_STALE_WHILE_REVALIDATE = ("/export/categ/favorites",)
+# Don't serve anything that expired longer ago than this, even stale-while-revalidate
+_MAX_STALE = 3600
+
+
+def _cache_ttl(endpoint: str) -> int | None:
+    for prefix, ttl in _CACHE_TTL:
+        if endpoint.startswith(prefix):
+            return ttl
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _url_for(endpoint: str) -> str:
+    return f"{get_base_url()}{endpoint}"
 
-from .config import INDICO_API_TOKEN, INDICO_BASE_URL
-from .models import Contribution, IndicoEvent, _parse_attachments, contribution_from_json, event_from_json
 
+def _send(url: str, params: dict | None = None, headers: dict | None = None) -> requests.Response:
+    """GET a prepared request on the shared session.
 
-def _get(endpoint: str, params: dict | None = None) -> dict:
-    """Authenticated GET against the Indico HTTP Export API."""
-    url = f"{INDICO_BASE_URL}{endpoint}"
-    headers = {"Authorization": f"Bearer {INDICO_API_TOKEN}"}
-    resp = requests.get(url, headers=headers, params=params, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    Environment settings (proxies, REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE) are merged in
+    per call, as Session.request does.
+    """
+    session = _get_session()
+    prepared = session.prepare_request(
+        requests.Request("GET", url, params=params, headers=headers)
+    )
+    settings = session.merge_environment_settings(prepared.url, {}, None, None, None)
+    return session.send(prepared, timeout=30, **settings)
+
+
+def _get(
+    endpoint: str,
+    params: dict | None = None,
+    on_refresh: Callable[[dict], None] | None = None,
+) -> dict:
+    """Authenticated GET against the Indico HTTP Export API, served from cache when fresh.
+
+    If a stale body is served (stale-while-revalidate), `on_refresh` is called with the
+    new body from the background thread once it arrives, unless the server sent back
+    the same content.
+    """
+    url = _url_for(endpoint)
+    ttl = _cache_ttl(endpoint)
+    if ttl is None:
+        resp = _send(url, params)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
+    cached = cache.load(url, params)
+    if cached is not None:
+        if cached.fresh:
+            return cached.body
+        if (
+            endpoint.startswith(_STALE_WHILE_REVALIDATE)
+            and time.time() - cached.expires_at < _MAX_STALE
+        ):
+            _executor.submit(_revalidate_and_notify, url, params, ttl, cached, on_refresh)
+            return cached.body
+    return _revalidate(url, params, ttl, cached)
 
-def get_favorite_events(limit: int = 100) -> list[IndicoEvent]:
-    """Fetch upcoming events from the user's favorited categories."""
+
+def _revalidate(url: str, params: dict | None, ttl: int, cached: cache.CachedResponse | None) -> dict:
+    """Fetch a cacheable URL (conditionally, if we hold an ETag) and refresh its cache entry."""
+    headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else None
+    resp = _send(url, params, headers)
+    if resp.status_code == 304 and cached is not None:
+        etag, body = cached.etag, cached.body
+    else:
+        resp.raise_for_status()
+        etag, body = resp.headers.get("ETag"), orjson.loads(resp.content)
+    cache.store(url, params, cache.CachedResponse(etag, body, time.time() + ttl))
+    return body
+
+
+def _revalidate_and_notify(
+    url: str,
+    params: dict | None,
+    ttl: int,
+    cached: cache.CachedResponse,
+    on_refresh: Callable[[dict], None] | None,
+) -> None:
+    body = _revalidate(url, params, ttl, cached)
+    # A 304 hands back the cached body itself: nothing changed
+    if on_refresh is not None and body is not cached.body:
+        on_refresh(body)
+
+
+def get_favorite_events(
+    limit: int = 100,
+    on_refresh: Callable[[list[IndicoEvent]], None] | None = None,
+) -> list[IndicoEvent]:
+    """Fetch upcoming events from the user's favorited categories.
+
+    The result may come from a stale cache entry; `on_refresh` then receives the
+    up-to-date events from a background thread when they arrive.
+    """
     data = _get(
         "/export/categ/favorites.json",
         params={"from": "today", "order": "start", "limit": str(limit)},
+        on_refresh=(
+            (lambda body: on_refresh(events_from_json_many(body.get("results", []))))
+            if on_refresh is not None
+            else None
+        ),
     )
     results = data.get("results", [])
-    return [event_from_json(item) for item in results]
+    return events_from_json_many(results)
 
 
 def get_timetable(event_id: int) -> list[Contribution]:
     """Fetch timetable entries for an event, returned as a flat list sorted by start time."""
-    data = _get(f"/export/timetable/{event_id}.json")
+    # The timetable endpoint often has files=null, so speculatively request the
+    # event contributions (which carry attachments) in parallel rather than after it
+    pending = _executor.submit(
+        _get, f"/export/event/{event_id}.json", {"detail": "contributions"}
+    )
+    try:
+        data = _get(f"/export/timetable/{event_id}.json")
+    except Exception:
+        pending.cancel()
+        raise
     results = data.get("results", {})
-    contributions: list[Contribution] = []
+    base_url = get_base_url()
+    parse_dt = _memoized_datetime_parser()
     # results is keyed by event_id → date → entry-id → entry dict
     event_data = results.get(str(event_id), {})
-    for _date, entries in event_data.items():
-        for _entry_id, entry in entries.items():
+    contributions = [
+        contribution_from_json(entry, base_url, parse_dt)
+        for entry in _timetable_entries(event_data)
+    ]
+    contributions.sort(key=lambda c: c.start_ts)
+
+    missing = {c.title for c in contributions if not c.attachments}
+    if missing:
+        _enrich_attachments(pending, contributions, missing)
+    else:
+        pending.cancel()
+
+    return contributions
+
+
+def _timetable_entries(event_data: dict) -> Iterator[dict]:
+    """Yield all timed entries of a timetable in one pass over its date → entry dicts."""
+    for entries in event_data.values():
+        for entry in entries.values():
             # Top-level entries (breaks, contributions)
             if "startDate" in entry:
-                contributions.append(contribution_from_json(entry, INDICO_BASE_URL))
+                yield entry
             # Session blocks contain nested entries
-            for nested in entry.get("entries", {}).values():
-                if "startDate" in nested:
-                    contributions.append(contribution_from_json(nested, INDICO_BASE_URL))
-    contributions.sort(key=lambda c: c.start_dt)
+            nested = entry.get("entries")
+            if nested:
+                for sub in nested.values():
+                    if "startDate" in sub:
+                        yield sub
 
-    # The timetable endpoint often has files=null; enrich from event contributions endpoint
-    contribs_without = [c for c in contributions if not c.attachments]
-    if contribs_without:
-        _enrich_attachments(event_id, contributions)
 
-    return contributions
+def get_timetables_bulk(event_ids: list[int]) -> dict[int, list[Contribution]]:
+    """Fetch timetables for several events concurrently, keyed by event id."""
+    # Own pool: get_timetable itself waits on _executor, so nesting it there could deadlock
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = {ex.submit(get_timetable, eid): eid for eid in event_ids}
+        return {futures[f]: f.result() for f in as_completed(futures)}
 
 
-def _enrich_attachments(event_id: int, contributions: list[Contribution]) -> None:
-    """Fetch attachment data from the event contributions endpoint and merge it in."""
+def _enrich_attachments(
+    pending: Future, contributions: list[Contribution], missing: set[str]
+) -> None:
+    """Merge attachment data from the (already requested) event contributions endpoint.
+
+    Only entries whose title is in `missing` (contributions without attachments) are parsed.
+    """
     try:
-        data = _get(
-            f"/export/event/{event_id}.json",
-            params={"detail": "contributions"},
-        )
+        data = pending.result()
     except Exception:
         return
+    base_url = get_base_url()
     # Build a lookup: title → list of attachments from the contributions endpoint
     att_by_title: dict[str, list[tuple[str, str]]] = {}
     for item in data.get("results", []):
         for c in item.get("contributions") or []:
             title = c.get("title", "")
-            atts = _parse_attachments(c, INDICO_BASE_URL)
+            if title not in missing:
+                continue
+            atts = _parse_attachments(c, base_url)
             if atts:
                 att_by_title[title] = atts
     # Merge into contributions that lack attachments
@@ -89,7 +265,40 @@ def get_category_events(
         },
     )
     results = data.get("results", [])
-    return [event_from_json(item) for item in results]
+    return events_from_json_many(results)
+
+
+class CategoryFetcher:
+    """Fetches category events on a small pool, sharing one request per category in flight.
+
+    Quickly drilling into several categories runs their requests concurrently, and
+    asking again for a category that is still loading waits on the same request.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tindico-categ")
+        self._inflight: dict[int, Future] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, category_id: int) -> Future:
+        """Return a Future for the category's events (see get_category_events)."""
+        with self._lock:
+            future = self._inflight.get(category_id)
+            if future is not None:
+                return future
+            future = self._pool.submit(get_category_events, category_id)
+            self._inflight[category_id] = future
+        # Registered outside the lock: it runs immediately if the future is already done
+        future.add_done_callback(lambda f: self._forget(category_id, f))
+        return future
+
+    def _forget(self, category_id: int, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(category_id) is future:
+                del self._inflight[category_id]
+
+
+category_fetcher = CategoryFetcher()
 
 
 def get_category_info(category_id: int) -> dict:
@@ -0,0 +1,67 @@
+import functools
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import orjson
+
+from .config import get_token
+
+CACHE_DIR = Path.home() / ".cache" / "tindico"
+
+
+@dataclass
+class CachedResponse:
+    etag: str | None
+    body: dict
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+def _cache_path(url: str, params: dict | None) -> Path:
+    """Map a request to a stable file name under CACHE_DIR, separate for each API token."""
+    # The token is part of the key, so switching accounts never serves the other's responses
+    key = f"{get_token()}\0{url}?{sorted((params or {}).items())}"
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def load(url: str, params: dict | None) -> CachedResponse | None:
+    """Return the cached response for a request, or None if missing/unreadable."""
+    try:
+        raw = orjson.loads(_cache_path(url, params).read_bytes())
+        return CachedResponse(raw["etag"], raw["body"], raw["expires_at"])
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        return None
+
+
+@functools.cache
+def _ensure_cache_dir() -> None:
+    """Create CACHE_DIR readable only by the user (bodies include restricted events)."""
+    CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkdir leaves an existing directory's mode alone
+    CACHE_DIR.chmod(0o700)
+
+
+def store(url: str, params: dict | None, entry: CachedResponse) -> None:
+    """Write a response to the cache; failures are ignored (the cache is best-effort)."""
+    path = _cache_path(url, params)
+    # Write to a per-thread temp file and rename, so concurrent readers never see partial JSON
+    tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+    try:
+        _ensure_cache_dir()
+        data = orjson.dumps(
+            {"etag": entry.etag, "body": entry.body, "expires_at": entry.expires_at}
+        )
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as f:
+            f.write(data)
+        tmp.replace(path)
+    except OSError:
+        pass
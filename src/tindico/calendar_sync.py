@@ -1,37 +1,107 @@
+import functools
+import hashlib
+import os
+import stat
 import subprocess
 import tempfile
 import threading
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timezone, tzinfo
 from pathlib import Path
 
 import EventKit
 from Foundation import NSDate, NSURL
-from icalendar import Calendar, Event, vText
 
 from .models import IndicoEvent
 
 
+def _escape(text: str) -> str:
+    """Escape a TEXT property value per RFC 5545."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line to at most 75 octets; continuation lines start with a space."""
+    if len(line.encode()) <= 75:
+        return line
+    parts = []
+    current = ""
+    size = 0
+    limit = 75
+    for ch in line:
+        n = len(ch.encode())
+        if size + n > limit:
+            parts.append(current)
+            current, size = "", 0
+            limit = 74  # the leading space counts towards the 75
+        current += ch
+        size += n
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def _ics_utc(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
 def create_ics(event: IndicoEvent) -> Path:
-    """Generate a .ics file for the given event and return its path."""
-    cal = Calendar()
-    cal.add("prodid", "-//tindico//indico.cern.ch//")
-    cal.add("version", "2.0")
-
-    vevent = Event()
-    vevent.add("uid", f"indico-event-{event.id}@indico.cern.ch")
-    vevent.add("summary", event.title)
-    vevent.add("dtstart", event.start_dt)
-    vevent.add("dtend", event.end_dt)
-    vevent.add("url", event.url)
-    vevent.add("location", vText(event.location))
-    vevent.add("description", event.description)
-
-    cal.add_component(vevent)
-
-    fd, name = tempfile.mkstemp(suffix=".ics", prefix=f"indico-{event.id}-")
-    path = Path(name)
-    with open(fd, "wb") as f:
-        f.write(cal.to_ical())
+    """Generate a .ics file for the given event and return its path.
+
+    The file name includes a hash of the exported fields, so exporting an
+    unchanged event again just returns the existing file -- provided it is
+    ours and holds exactly the expected content, since the temp dir is shared.
+    """
+    key = hashlib.blake2b(
+        f"{event.id}|{event.start_dt.isoformat()}|{event.end_dt.isoformat()}|"
+        f"{event.title}|{event.url}|{event.location}|{event.description}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    path = Path(tempfile.gettempdir()) / f"indico-{event.id}-{key}.ics"
+
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//tindico//indico.cern.ch//",
+        "BEGIN:VEVENT",
+        f"UID:indico-event-{event.id}@indico.cern.ch",
+        f"SUMMARY:{_escape(event.title)}",
+        f"DTSTART:{_ics_utc(event.start_dt)}",
+        f"DTEND:{_ics_utc(event.end_dt)}",
+        f"URL:{event.url}",
+        f"LOCATION:{_escape(event.location)}",
+        f"DESCRIPTION:{_escape(event.description)}",
+        "END:VEVENT",
+        "END:VCALENDAR",
+    ]
+    data = "".join(f"{_fold(line)}\r\n" for line in lines).encode()
+
+    try:
+        st = path.lstat()
+        if (
+            stat.S_ISREG(st.st_mode)
+            and st.st_uid == os.getuid()
+            and path.read_bytes() == data
+        ):
+            return path
+    except OSError:
+        pass
+
+    # Write a private temp file and rename it into place, so a concurrent export
+    # of the same event never hands out a half-written file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"indico-{event.id}-", suffix=".ics")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        # e.g. another user's file under that name in a sticky temp dir
+        return Path(tmp)
     return path
 
 
@@ -79,6 +149,12 @@ def warm_event_store():
     threading.Thread(target=_get_event_store, daemon=True).start()
 
 
+# Bumped whenever we modify a calendar event, invalidating cached lookups
+_calendar_epoch = 0
+# Cached lookups also expire after this many seconds, to pick up edits made in Calendar.app
+_FIND_CACHE_TTL = 5.0
+
+
 def find_calendar_events(event: IndicoEvent) -> list[dict]:
     """Find calendar events on the same day as the Indico event.
 
@@ -86,13 +162,29 @@ def find_calendar_events(event: IndicoEvent) -> list[dict]:
     then remaining events by start time:
         {"title": str, "start": datetime, "calendar": str,
          "existing_url": str | None, "ek_event_id": str}
+
+    Results are cached for a few seconds (and until set_event_url changes
+    something), so repeated lookups don't re-query EventKit.
     """
+    bucket = int(time.monotonic() // _FIND_CACHE_TTL)
+    # Aware datetimes compare equal across timezones, but the day window and the
+    # returned start times depend on the zone, so it's part of the cache key too
+    cached = _find_calendar_events_cached(
+        event.start_dt, event.start_dt.tzinfo, _calendar_epoch, bucket
+    )
+    return [dict(r) for r in cached]
+
+
+@functools.lru_cache(maxsize=64)
+def _find_calendar_events_cached(
+    event_start: datetime, _tz: tzinfo | None, _epoch: int, _bucket: int
+) -> tuple[dict, ...]:
     store = _get_event_store()
     if store is None:
-        return []
+        return ()
 
-    start_of_day = event.start_dt.replace(hour=0, minute=0, second=0)
-    end_of_day = event.start_dt.replace(hour=23, minute=59, second=59)
+    start_of_day = event_start.replace(hour=0, minute=0, second=0)
+    end_of_day = event_start.replace(hour=23, minute=59, second=59)
     ns_start = NSDate.dateWithTimeIntervalSince1970_(start_of_day.timestamp())
     ns_end = NSDate.dateWithTimeIntervalSince1970_(end_of_day.timestamp())
 
@@ -101,31 +193,30 @@ def find_calendar_events(event: IndicoEvent) -> list[dict]:
     )
     matches = store.eventsMatchingPredicate_(predicate)
     if not matches:
-        return []
+        return ()
 
-    results = []
+    # Compare start times at minute resolution via integer POSIX minutes
+    event_minute = int(event_start.timestamp()) // 60
+    keyed = []
     for cal_event in matches:
         start_ts = cal_event.startDate().timeIntervalSince1970()
         start_dt = datetime.fromtimestamp(start_ts, tz=timezone.utc).astimezone(
-            event.start_dt.tzinfo
+            event_start.tzinfo
         )
-        existing_url = cal_event.URL().absoluteString() if cal_event.URL() else None
-        results.append({
+        url = cal_event.URL()
+        result = {
             "title": str(cal_event.title()),
             "start": start_dt,
             "calendar": str(cal_event.calendar().title()),
-            "existing_url": existing_url,
+            "existing_url": url.absoluteString() if url else None,
             "ek_event_id": str(cal_event.eventIdentifier()),
             "ek_start_ts": start_ts,
-        })
-
-    event_time = event.start_dt.replace(second=0, microsecond=0)
-    exact = [r for r in results if r["start"].replace(second=0, microsecond=0) == event_time]
-    rest = [r for r in results if r["start"].replace(second=0, microsecond=0) != event_time]
-    exact.sort(key=lambda r: r["start"])
-    rest.sort(key=lambda r: r["start"])
+        }
+        keyed.append((int(start_ts) // 60 != event_minute, start_ts, result))
 
-    return exact + rest
+    # One sort: exact start-time matches (False sorts first), then by start time
+    keyed.sort(key=lambda k: k[:2])
+    return tuple(result for _not_exact, _ts, result in keyed)
 
 
 def set_event_url(event_id: str, start_ts: float, url: str) -> bool:
@@ -164,4 +255,6 @@ def set_event_url(event_id: str, start_ts: float, url: str) -> bool:
     ok, error = store.commit_(None)
     if not ok:
         raise RuntimeError(f"Failed to commit: {error}")
+    global _calendar_epoch
+    _calendar_epoch += 1
     return True
@@ -1,3 +1,5 @@
+import functools
+import os
 from pathlib import Path
 
 
@@ -6,31 +8,44 @@ def load_env(path: Path | None = None) -> dict[str, str]:
     if path is None:
         path = Path(__file__).resolve().parents[2] / ".env"
     env = {}
-    if not path.exists():
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
         return env
-    for line in path.read_text().splitlines():
+    for line in raw.splitlines():
         line = line.strip()
-        if not line or line.startswith("#"):
+        if not line or line.startswith(b"#"):
             continue
-        if "=" in line:
-            key, _, value = line.partition("=")
-            env[key.strip()] = value.strip()
+        key, sep, value = line.partition(b"=")
+        if sep:
+            env[key.strip().decode()] = value.strip().decode()
     return env
 
 
-_env = load_env()
+@functools.cache
+def _env() -> dict[str, str]:
+    return load_env()
 
-INDICO_BASE_URL: str = _env.get("INDICO_BASE_URL", "https://indico.cern.ch")
-INDICO_API_TOKEN: str = _env.get("INDICO_API_TOKEN", "")
 
-if not INDICO_API_TOKEN:
-    import sys
+def _setting(key: str, default: str = "") -> str:
+    """Look up a setting, preferring the process environment over the .env file."""
+    return os.environ.get(key) or _env().get(key, default)
 
-    print(
-        "Error: INDICO_API_TOKEN not set.\n"
-        "Create a .env file in the project root with:\n"
-        "  INDICO_API_TOKEN=your_token_here\n"
-        "Get a token at https://indico.cern.ch/user/tokens/",
-        file=sys.stderr,
-    )
-    sys.exit(1)
+
+@functools.cache
+def get_base_url() -> str:
+    return _setting("INDICO_BASE_URL", "https://indico.cern.ch")
+
+
+@functools.cache
+def get_token() -> str:
+    """Return the Indico API token; raises RuntimeError with setup instructions if unset."""
+    token = _setting("INDICO_API_TOKEN")
+    if not token:
+        raise RuntimeError(
+            "INDICO_API_TOKEN not set.\n"
+            "Create a .env file in the project root with:\n"
+            "  INDICO_API_TOKEN=your_token_here\n"
+            "Get a token at https://indico.cern.ch/user/tokens/"
+        )
+    return token
@@ -1,9 +1,19 @@
+import functools
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+# Widths of the title and category columns in the event table
+TITLE_WIDTH = 42
+CATEGORY_WIDTH = 20
 
-@dataclass
+# Abbreviated names as strftime's %a/%b give them in the C locale (the app never sets one)
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+@dataclass(slots=True, frozen=True)
 class IndicoEvent:
     id: int
     title: str
@@ -16,6 +26,27 @@ class IndicoEvent:
     category: str = ""
     category_id: int = 0
     event_type: str = ""
+    # Event table cell strings, built once here so table rebuilds only read attributes
+    day_str: str = field(init=False, repr=False, compare=False)
+    date_str: str = field(init=False, repr=False, compare=False)
+    time_str: str = field(init=False, repr=False, compare=False)
+    title_short: str = field(init=False, repr=False, compare=False)
+    category_short: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        dt = self.start_dt
+        # Frozen: derived fields have to bypass the generated __setattr__
+        set_ = object.__setattr__
+        set_(self, "day_str", WEEKDAYS[dt.weekday()])
+        set_(self, "date_str", f"{MONTHS[dt.month - 1]} {dt.day:>2}")
+        set_(self, "time_str", f"{dt.hour:02d}:{dt.minute:02d}")
+        set_(self, "title_short", self.title[:TITLE_WIDTH])
+        set_(self, "category_short", self.category[:CATEGORY_WIDTH])
+
+
+@functools.lru_cache(maxsize=64)
+def _tz(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
 
 
 def parse_indico_datetime(dt_dict: dict) -> datetime:
@@ -23,18 +54,39 @@ def parse_indico_datetime(dt_dict: dict) -> datetime:
 
     Expected format: {"date": "2025-03-15", "time": "14:00:00", "tz": "Europe/Zurich"}
     """
-    tz = ZoneInfo(dt_dict["tz"])
-    naive = datetime.strptime(f"{dt_dict['date']} {dt_dict['time']}", "%Y-%m-%d %H:%M:%S")
-    return naive.replace(tzinfo=tz)
+    naive = datetime.fromisoformat(f"{dt_dict['date']}T{dt_dict['time']}")
+    return naive.replace(tzinfo=_tz(dt_dict["tz"]))
+
+
+def _memoized_datetime_parser() -> Callable[[dict], datetime]:
+    """Return a parse_indico_datetime wrapper that parses each (date, time, tz) only once.
+
+    Meant for one batch of results, where many entries share start/end times.
+    """
+    memo: dict[tuple[str, str, str], datetime] = {}
+
+    def parse(dt_dict: dict) -> datetime:
+        key = (dt_dict["date"], dt_dict["time"], dt_dict["tz"])
+        dt = memo.get(key)
+        if dt is None:
+            dt = memo[key] = parse_indico_datetime(dt_dict)
+        return dt
+
+    return parse
 
 
-@dataclass
+@dataclass(slots=True)
 class Contribution:
     title: str
     start_dt: datetime
     end_dt: datetime
     speakers: list[str]
     attachments: list[tuple[str, str]] = field(default_factory=list)
+    # POSIX start time, so sorting compares floats instead of tz-aware datetimes
+    start_ts: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.start_ts = self.start_dt.timestamp()
 
 
 def _parse_attachments(entry: dict, base_url: str) -> list[tuple[str, str]]:
@@ -64,7 +116,11 @@ def _parse_attachments(entry: dict, base_url: str) -> list[tuple[str, str]]:
     return attachments
 
 
-def contribution_from_json(entry: dict, base_url: str = "") -> Contribution:
+def contribution_from_json(
+    entry: dict,
+    base_url: str = "",
+    parse_dt: Callable[[dict], datetime] = parse_indico_datetime,
+) -> Contribution:
     """Build a Contribution from a timetable entry."""
     speakers = []
     for person in entry.get("presenters", []):
@@ -76,21 +132,23 @@ def contribution_from_json(entry: dict, base_url: str = "") -> Contribution:
 
     return Contribution(
         title=entry.get("title", ""),
-        start_dt=parse_indico_datetime(entry["startDate"]),
-        end_dt=parse_indico_datetime(entry["endDate"]),
+        start_dt=parse_dt(entry["startDate"]),
+        end_dt=parse_dt(entry["endDate"]),
         speakers=speakers,
         attachments=attachments,
     )
 
 
-def event_from_json(data: dict) -> IndicoEvent:
+def event_from_json(
+    data: dict, parse_dt: Callable[[dict], datetime] = parse_indico_datetime
+) -> IndicoEvent:
     """Build an IndicoEvent from the JSON returned by the Indico HTTP Export API."""
     return IndicoEvent(
         id=int(data["id"]),
         title=data.get("title", ""),
         url=data.get("url", ""),
-        start_dt=parse_indico_datetime(data["startDate"]),
-        end_dt=parse_indico_datetime(data["endDate"]),
+        start_dt=parse_dt(data["startDate"]),
+        end_dt=parse_dt(data["endDate"]),
         timezone=data["startDate"]["tz"],
         description=data.get("description", ""),
         location=data.get("location", ""),
@@ -98,3 +156,9 @@ def event_from_json(data: dict) -> IndicoEvent:
         category_id=int(data.get("categoryId", 0)),
         event_type=data.get("type", ""),
     )
+
+
+def events_from_json_many(items: list[dict]) -> list[IndicoEvent]:
+    """Build IndicoEvents for a whole result list, parsing repeated datetimes once."""
+    parse_dt = _memoized_datetime_parser()
+    return [event_from_json(item, parse_dt) for item in items]
@@ -1,8 +1,13 @@
 import re
 import subprocess
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
 from dataclasses import dataclass, field
+from datetime import date
 from enum import Enum, auto
+from functools import lru_cache
+from itertools import chain, groupby
 
 import requests
 
@@ -12,20 +17,69 @@ from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import DataTable, Footer, Header, Input, OptionList, Static
 from textual.widgets.option_list import Option
 
-from .api import get_category_events, get_category_info, get_favorite_events, get_timetable
+from .api import category_fetcher, get_category_info, get_favorite_events, get_timetable
 from .calendar_sync import (
     find_calendar_events,
     open_in_calendar,
     set_event_url,
     warm_event_store,
 )
-from .models import Contribution, IndicoEvent
+from .models import CATEGORY_WIDTH, TITLE_WIDTH, Contribution, IndicoEvent
 
 DIM = Style(dim=True)
 DIM_ITALIC = Style(dim=True, italic=True)
+# Blank table cell; DataTable only reads cells, so one instance serves every row
+_EMPTY_TEXT = Text("")
+
+
+def _event_day(ev: IndicoEvent) -> date:
+    return ev.start_dt.date()
+
+
+# Side requests issued from inside workers (e.g. category info alongside its events)
+_io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tindico-io")
+
+
+@lru_cache(maxsize=16)
+def _accent_style(hex_: str, bold: bool | None = None) -> Style:
+    """Return a shared Style for an accent color (parsing colors isn't free)."""
+    return Style(color=hex_, bold=bold)
+
+
+# Entries kept in each of the app's per-id caches before the least recently used is evicted
+_CACHE_MAX = 256
+
+
+class _LRU(OrderedDict):
+    """An OrderedDict capped at `maxsize` entries, evicting the least recently used.
+
+    Plain reads (`in`, `get`, `[]`) don't count as a use; lookup() does.
+    """
+
+    def __init__(self, maxsize: int = _CACHE_MAX) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def lookup(self, key):
+        """Return self[key] (None if missing), marking it most recently used."""
+        value = self.get(key)
+        if value is not None:
+            try:
+                self.move_to_end(key)
+            except KeyError:  # evicted by a worker thread in between
+                pass
+        return value
+
+    def put(self, key, value) -> None:
+        """Insert or replace an entry, evicting the oldest ones beyond maxsize."""
+        self[key] = value
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
 
 
 def _escape_rich(text: str) -> str:
@@ -96,58 +150,144 @@ class DetailPanel(OptionList):
         ideal = int(available * 0.25)
         return max(DetailPanel._MIN_HEIGHT, min(ideal, DetailPanel._MAX_HEIGHT, max_for_bottom))
 
+    # Contributions rendered past the visible window; more are added as the highlight nears the end
+    _RENDER_AHEAD = 20
+    # Events whose built options are kept for when they are shown again
+    _OPTIONS_CACHE_MAX = 64
+
     def __init__(self) -> None:
         super().__init__(Option("No event selected", disabled=True))
-        self._contributions: dict[str, Contribution] = {}
+        # Contribution for each option index (None for dividers/messages)
+        self._contrib_by_row: list[Contribution | None] = []
+        # All contributions of the shown event; only the first _rendered have options so far
+        self._pending: list[Contribution] = []
+        self._rendered = 0
+        self._prev_date = None
+        self._accent = Style()
+        # Event whose contributions are shown (None for messages)
+        self._event_id: int | None = None
+        # event id → (contributions, accent, options, contrib_by_row, rendered, prev_date)
+        self._rendered_options: _LRU = _LRU(self._OPTIONS_CACHE_MAX)
+
+    def _stash_rendered(self) -> None:
+        """Remember the options built for the shown event so showing it again reuses them."""
+        if self._event_id is not None and self._rendered:
+            self._rendered_options.put(
+                self._event_id,
+                (
+                    self._pending, self._accent, list(self.options),
+                    self._contrib_by_row, self._rendered, self._prev_date,
+                ),
+            )
+        self._event_id = None
 
     def set_message(self, text: str) -> None:
         """Show a simple message (Loading..., No event selected, etc.)."""
-        self._contributions = {}
+        self._stash_rendered()
+        self._contrib_by_row = []
+        self._pending = []
         self.clear_options()
         self.add_option(Option(text, disabled=True))
 
-    def set_contributions(self, contributions: list[Contribution]) -> None:
-        """Populate the list with contributions. Those with attachments get a * suffix."""
-        self._contributions = {}
+    def set_contributions(
+        self,
+        contributions: list[Contribution],
+        accent: Style,
+        event_id: int | None = None,
+        prerendered: tuple | None = None,
+    ) -> None:
+        """Populate the list with contributions. Those with attachments get a * suffix.
+
+        Only the first screenful (plus _RENDER_AHEAD) is rendered up front. Options
+        already built for `event_id` (or passed in as `prerendered`, see prerender)
+        are reused if their contributions and accent match.
+        """
+        self._stash_rendered()
         self.clear_options()
+        self._pending = contributions
         if not contributions:
+            self._contrib_by_row = []
             self.add_option(Option("No contributions", disabled=True))
             return
-        accent_hex = self.app.current_theme.to_color_system().accent.hex
-        prev_date = None
-        for i, c in enumerate(contributions):
+        self._event_id = event_id
+        self._accent = accent
+        cached = self._rendered_options.lookup(event_id) if event_id is not None else None
+        for entry in (cached, prerendered):
+            if entry is not None and entry[0] is contributions and entry[1] == accent:
+                _contribs, _accent, options, contrib_by_row, self._rendered, self._prev_date = entry
+                self._contrib_by_row = list(contrib_by_row)
+                self.add_options(options)
+                return
+        self._contrib_by_row = []
+        self._rendered = 0
+        self._prev_date = None
+        self._render_more(self._MAX_HEIGHT + self._RENDER_AHEAD)
+
+    @classmethod
+    def prerender(cls, contributions: list[Contribution], accent: Style) -> tuple:
+        """Build the up-front options for set_contributions(prerendered=...), off the UI thread."""
+        end = min(cls._MAX_HEIGHT + cls._RENDER_AHEAD, len(contributions))
+        options, contrib_by_row, prev_date = cls._build_options(contributions, 0, end, accent, None)
+        return contributions, accent, options, contrib_by_row, end, prev_date
+
+    @staticmethod
+    def _build_options(
+        contributions: list[Contribution],
+        start: int,
+        end: int,
+        accent: Style,
+        prev_date: date | None,
+    ) -> tuple[list[Option], list[Contribution | None], date | None]:
+        """Build options for contributions[start:end], with day dividers after `prev_date`."""
+        options = []
+        contrib_by_row: list[Contribution | None] = []
+        for i in range(start, end):
+            c = contributions[i]
             date_key = c.start_dt.date()
             if prev_date is not None and date_key != prev_date:
-                day_label = Text(
-                    f"── {c.start_dt.strftime('%A %b %d').replace(' 0', ' ')} ──",
-                    style=DIM,
-                )
-                self.add_option(Option(day_label, disabled=True))
+                day_label = Text(f"── {c.start_dt:%A %b} {c.start_dt.day} ──", style=DIM)
+                options.append(Option(day_label, disabled=True))
+                contrib_by_row.append(None)
             prev_date = date_key
-            time_str = c.start_dt.strftime("%H:%M")
+            time_str = f"{c.start_dt.hour:02d}:{c.start_dt.minute:02d}"
             speakers = ", ".join(c.speakers)
-            label = Text()
-            label.append(time_str, style="bold")
-            label.append("  ")
-            label.append(c.title, style=Style(color=accent_hex))
-            if speakers:
-                label.append(f" [{speakers}]", style=DIM_ITALIC)
-            if c.attachments:
-                label.append(" ●", style="bold")
-            opt_id = f"contrib_{i}"
-            self.add_option(Option(label, id=opt_id))
-            self._contributions[opt_id] = c
+            label = Text.assemble(
+                (time_str, "bold"),
+                "  ",
+                (c.title, accent),
+                (f" [{speakers}]" if speakers else "", DIM_ITALIC),
+                (" ●" if c.attachments else "", "bold"),
+            )
+            options.append(Option(label))
+            contrib_by_row.append(c)
+        return options, contrib_by_row, prev_date
+
+    def _render_more(self, count: int) -> None:
+        """Add options for the next `count` not-yet-rendered contributions."""
+        end = min(self._rendered + count, len(self._pending))
+        options, contrib_by_row, self._prev_date = self._build_options(
+            self._pending, self._rendered, end, self._accent, self._prev_date
+        )
+        self._contrib_by_row.extend(contrib_by_row)
+        self._rendered = end
+        self.add_options(options)
+
+    def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
+        if (
+            self._rendered < len(self._pending)
+            and event.option_index >= self.option_count - self._RENDER_AHEAD // 2
+        ):
+            self._render_more(self._RENDER_AHEAD)
 
     def on_focus(self) -> None:
-        if self._contributions and self.highlighted is None:
+        if self._contrib_by_row and self.highlighted is None:
             self.highlighted = 0
 
     def selected_contribution(self) -> Contribution | None:
         """Return the currently highlighted contribution, if any."""
-        if self.highlighted is None:
+        if self.highlighted is None or self.highlighted >= len(self._contrib_by_row):
             return None
-        option = self.get_option_at_index(self.highlighted)
-        return self._contributions.get(option.id)
+        return self._contrib_by_row[self.highlighted]
 
 
 class StatusBar(Static):
@@ -187,20 +327,19 @@ class AttachmentPicker(ModalScreen[str | None]):
         self._attachments = attachments
 
     def compose(self) -> ComposeResult:
-        ol = OptionList()
-        for i, (title, _url) in enumerate(self._attachments):
-            ol.add_option(Option(title, id=f"att_{i}"))
+        ol = self._options = OptionList()
+        for title, _url in self._attachments:
+            ol.add_option(Option(title))
         ol.highlighted = 0
         yield ol
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
-        idx = int(event.option_id.split("_")[1])
-        _title, url = self._attachments[idx]
+        _title, url = self._attachments[event.option_index]
         self.dismiss(url)
 
     def select_highlighted(self) -> None:
         """Open the currently highlighted attachment."""
-        ol = self.query_one(OptionList)
+        ol = self._options
         if ol.highlighted is not None:
             _title, url = self._attachments[ol.highlighted]
             self.dismiss(url)
@@ -234,9 +373,11 @@ class CalendarEventPicker(ModalScreen[tuple | None]):
         super().__init__()
         self._candidates = candidates
         self._indico_start = indico_start
+        # Candidate index for each option index (None for the divider)
+        self._candidate_by_row: list[int | None] = []
 
     def compose(self) -> ComposeResult:
-        ol = OptionList()
+        ol = self._options = OptionList()
         event_time = self._indico_start.replace(second=0, microsecond=0)
         past_exact = False
         for i, c in enumerate(self._candidates):
@@ -247,32 +388,36 @@ class CalendarEventPicker(ModalScreen[tuple | None]):
                     Text("───── other events ─────", style=DIM),
                     disabled=True,
                 ))
+                self._candidate_by_row.append(None)
             time_str = c["start"].strftime("%H:%M")
-            label = Text()
-            label.append(time_str, style="bold")
-            label.append("  ")
-            label.append(c["title"])
-            label.append(f"  [{c['calendar']}]", style=DIM_ITALIC)
-            ol.add_option(Option(label, id=f"cal_{i}"))
+            label = Text.assemble(
+                (time_str, "bold"),
+                "  ",
+                c["title"],
+                (f"  [{c['calendar']}]", DIM_ITALIC),
+            )
+            ol.add_option(Option(label))
+            self._candidate_by_row.append(i)
         ol.highlighted = 0
         yield ol
 
-    def _dismiss_with(self, idx: int) -> None:
+    def _dismiss_with(self, row: int) -> bool:
+        """Dismiss with the candidate at option index `row`; False if it isn't one."""
+        idx = self._candidate_by_row[row]
+        if idx is None:
+            return False
         c = self._candidates[idx]
         self.dismiss((c["ek_event_id"], c["ek_start_ts"]))
+        return True
 
     def action_confirm(self) -> None:
-        ol = self.query_one(OptionList)
-        if ol.highlighted is not None:
-            option = ol.get_option_at_index(ol.highlighted)
-            if option.id and option.id.startswith("cal_"):
-                self._dismiss_with(int(option.id.split("_")[1]))
-                return
+        ol = self._options
+        if ol.highlighted is not None and self._dismiss_with(ol.highlighted):
+            return
         self.dismiss(None)
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
-        if event.option_id and event.option_id.startswith("cal_"):
-            self._dismiss_with(int(event.option_id.split("_")[1]))
+        self._dismiss_with(event.option_index)
 
     def action_cancel(self) -> None:
         self.dismiss(None)
@@ -342,62 +487,180 @@ class IndicoApp(App):
         ("Day", 3),
         ("Date", 6),
         ("Time", 5),
-        ("Title", 42),
-        ("Category", 20),
+        ("Title", TITLE_WIDTH),
+        ("Category", CATEGORY_WIDTH),
     ]
+    # Separator cells are constant, so every separator row shares the same Text objects
+    _SEPARATOR_CELLS = tuple(Text("─" * w, style=DIM) for _name, w in _TABLE_COLUMNS)
+    # Theme-independent cells of subcategory rows, likewise shared
+    _SUBCAT_ARROW = Text("  →", style="bold")
+    _SUBCAT_LABEL = Text("subcategory", style=DIM_ITALIC)
+
+    # Categories whose fully built (unfiltered) rows are kept for re-entry
+    _CATEGORY_ROWS_CACHE_MAX = 16
+    # Number of events below/above the cursor whose timetables are fetched in the background
+    _PREFETCH_AHEAD = 3
+    _PREFETCH_BEHIND = 2
+    # Favorites whose timetables are fetched right after loading, and how many at once
+    _WARMUP_COUNT = 10
+    _WARMUP_CONCURRENCY = 2
+    # Seconds the cursor must rest on a row before its timetable is requested
+    _HIGHLIGHT_DEBOUNCE = 0.15
+    # Seconds a category's events wait for its info before being shown without subcategories
+    _INFO_WAIT = 0.3
+    # Seconds after launching `open` before checking whether it failed
+    _OPEN_CHECK_DELAY = 1.0
 
     @property
     def _accent_hex(self) -> str:
-        """Get the current theme's accent color as a hex string."""
-        cs = self.current_theme.to_color_system()
-        return cs.accent.hex
+        """Get the current theme's accent color as a hex string (cached until the theme changes)."""
+        if self._accent_hex_cached is None:
+            self._accent_hex_cached = self.current_theme.to_color_system().accent.hex
+        return self._accent_hex_cached
+
+    @property
+    def _accent(self) -> Style:
+        """The accent-colored text style for the current theme."""
+        return _accent_style(self._accent_hex)
 
     def _setup_table_columns(self, table: DataTable) -> None:
-        """Clear and re-add standard columns to the table."""
+        """Clear the table rows, re-adding the standard columns only if they differ."""
+        self._ordered_row_keys = []
+        signature = tuple(self._TABLE_COLUMNS)
+        if self._columns_signature == signature:
+            table.clear()
+            return
         table.clear(columns=True)
         for name, width in self._TABLE_COLUMNS:
             table.add_column(name, width=width)
+        self._columns_signature = signature
 
     def _add_separator_row(self, table: DataTable, key: str) -> None:
         """Add a dim separator row to the table."""
-        table.add_row(
-            *(Text("─" * w, style=DIM) for _name, w in self._TABLE_COLUMNS),
-            key=key,
-        )
+        table.add_row(*self._SEPARATOR_CELLS, key=key)
+        self._ordered_row_keys.append(key)
 
-    def _add_event_row(
-        self, table: DataTable, ev: IndicoEvent, first_of_day: bool, accent: Style,
-    ) -> str:
-        """Add an event row to the table and return its row key."""
-        row_key = str(ev.id)
-        table.add_row(
-            Text(ev.start_dt.strftime("%a"), style=DIM) if first_of_day else Text(""),
-            Text(ev.start_dt.strftime("%b %d").replace(" 0", "  ")) if first_of_day else Text(""),
-            Text(ev.start_dt.strftime("%H:%M")),
-            Text(ev.title[:42], style=accent),
-            Text(ev.category[:20], style=DIM_ITALIC),
-            key=row_key,
-        )
-        self._row_key_to_event[row_key] = ev
-        return row_key
+    def _row_key_at(self, row: int | None) -> str | None:
+        """Return the key of the table row at index `row`, or None if out of range."""
+        if row is None or not 0 <= row < len(self._ordered_row_keys):
+            return None
+        return self._ordered_row_keys[row]
+
+    def _emit_event_rows(
+        self,
+        table: DataTable,
+        events: list[IndicoEvent],
+        accent: Style,
+        regex: re.Pattern | None,
+    ) -> int:
+        """Add event rows with day separators; returns the number of events shown."""
+        # Filter up front so the row loop itself has no per-row filter branch
+        if regex is not None:
+            search = regex.search
+            events = [ev for ev in events if search(ev.title) or search(ev.category)]
+        sep_prefix = self.SEPARATOR_KEY_PREFIX
+        separator_cells = self._SEPARATOR_CELLS
+        add_row = table.add_row
+        row_map = self._row_key_to_event
+        append_key = self._ordered_row_keys.append
+        # One separator per day boundary, and the weekday/date only on a day's first row
+        for i, (day, group) in enumerate(groupby(events, key=_event_day)):
+            if i:
+                sep_key = f"{sep_prefix}{day.isoformat()}"
+                add_row(*separator_cells, key=sep_key)
+                append_key(sep_key)
+            ev = next(group)
+            day_cell = Text(ev.day_str, style=DIM)
+            date_cell = Text(ev.date_str)
+            for ev in chain((ev,), group):
+                row_key = str(ev.id)
+                add_row(
+                    day_cell,
+                    date_cell,
+                    Text(ev.time_str),
+                    Text(ev.title_short, style=accent),
+                    Text(ev.category_short, style=DIM_ITALIC),
+                    key=row_key,
+                )
+                append_key(row_key)
+                row_map[row_key] = ev
+                day_cell = date_cell = _EMPTY_TEXT
+        return len(events)
+
+    def _set_status(self, message: str) -> None:
+        """Show a status bar message; several set in one go are rendered once, last one wins."""
+        flush_scheduled = self._pending_status is not None
+        self._pending_status = message
+        if not flush_scheduled:
+            self.call_later(self._flush_status)
+
+    def _flush_status(self) -> None:
+        message, self._pending_status = self._pending_status, None
+        # The bar is one line high whatever it says, so skip the layout pass
+        self._status.update(message, layout=False)
 
     def _open_url(self, url: str, label: str = "") -> None:
         """Open a URL in the default browser and update the status bar."""
-        subprocess.run(["open", url])
-        self.query_one(StatusBar).update(f"Opened {label or url}")
+        # Don't wait for `open` to exit; check on it once it has had time to finish
+        try:
+            proc = subprocess.Popen(
+                ["open", url],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError as e:
+            self._set_status(f"Could not open {label or url}: {e}")
+            return
+        self._set_status(f"Opened {label or url}")
+        self.set_timer(self._OPEN_CHECK_DELAY, lambda: self._check_open(proc, label or url))
+
+    def _check_open(self, proc: subprocess.Popen, what: str) -> None:
+        """Report a failed `open` (e.g. no application for the URL) in the status bar."""
+        if proc.poll():
+            self._set_status(f"Could not open {what} (open exited with {proc.returncode})")
 
     def __init__(self) -> None:
         super().__init__()
         self.events: list[IndicoEvent] = []
         self._row_key_to_event: dict[str, IndicoEvent] = {}
-        self._timetable_cache: dict[int, list[Contribution]] = {}
-        self._category_events_cache: dict[int, list[IndicoEvent]] = {}
-        self._category_info_cache: dict[int, dict] = {}
+        # Row keys in table order, so cursor lookups needn't go through DataTable.ordered_rows
+        self._ordered_row_keys: list[str] = []
+        # (name, width) pairs of the table's current columns, to skip re-adding identical ones
+        self._columns_signature: tuple[tuple[str, int], ...] | None = None
+        self._timetable_cache: _LRU = _LRU()
+        # event id → DetailPanel.prerender() output, built on the worker that fetched it
+        self._formatted_timetable_cache: _LRU = _LRU()
+        # Event ids with a timetable request in flight (foreground or prefetch)
+        self._timetable_inflight: set[int] = set()
+        # Pending debounce timer for the highlighted row's fetch (None if idle)
+        self._highlight_timer: Timer | None = None
+        # Bumped each time the cursor settles; stale prefetches check it and bail out
+        self._highlight_gen = 0
+        # Latest _set_status message not yet shown (None when nothing is pending)
+        self._pending_status: str | None = None
+        # Event ids still to be warmed by _warm_timetables
+        self._warmup_queue: deque[int] = deque()
+        # Set on unmount so pool threads finishing a fetch don't call back into the app
+        self._closing = False
+        # category id → events / info
+        self._category_events_cache: _LRU = _LRU()
+        self._category_info_cache: _LRU = _LRU()
+        # category id → (events, info, accent hex, [(cells, key)], row map) of its unfiltered table
+        self._category_rows_cache: _LRU = _LRU(self._CATEGORY_ROWS_CACHE_MAX)
         self._current_detail_event_id: int | None = None
+        # Last cursor row that landed on a real row, to skip separators in the same direction
+        self._prev_cursor_row: int = 0
         self._nav_stack: list[NavEntry] = [NavEntry(ViewMode.FAVORITES)]
         self._subcat_names: dict[int, str] = {}
         self._update_url_event: IndicoEvent | None = None
         self._regex_filter: str = ""
+        # Compiled form of _regex_filter (None when no filter); set by _set_regex_filter
+        self._regex_pattern: re.Pattern | None = None
+        # Accent hex the table was last rendered with (None before first render)
+        self._last_rendered_accent: str | None = None
+        # Current theme's accent hex, computed on first use after each theme change
+        self._accent_hex_cached: str | None = None
 
     @property
     def _current_nav(self) -> NavEntry:
@@ -416,28 +679,38 @@ class IndicoApp(App):
         return self._current_nav.category_name
 
     def compose(self) -> ComposeResult:
+        # Keep references to the widgets used on hot paths instead of querying the DOM
+        self._table = DataTable(cursor_type="row")
+        self._panel = DetailPanel()
+        self._status = StatusBar("Loading...")
         yield Header()
-        yield DataTable(cursor_type="row")
+        yield self._table
         yield DetailDivider()
-        yield DetailPanel()
-        yield StatusBar("Loading...")
+        yield self._panel
+        yield self._status
         yield Footer()
 
     def on_mount(self) -> None:
         warm_event_store()
-        table = self.query_one(DataTable)
-        for name, width in self._TABLE_COLUMNS:
-            table.add_column(name, width=width)
+        # Timetable fetches (foreground and prefetch) share these threads instead of
+        # starting one per highlight; bounded so bursts can't flood the server
+        self._timetable_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tindico-timetable")
+        self._setup_table_columns(self._table)
         self._sync_detail_height()
         self._load_events()
 
+    def on_unmount(self) -> None:
+        # Running warmup drains stop after their current fetch; queued tasks are cancelled
+        self._closing = True
+        self._warmup_queue.clear()
+        self._timetable_pool.shutdown(wait=False, cancel_futures=True)
+
     def on_resize(self) -> None:
         self._sync_detail_height()
 
     def _sync_detail_height(self) -> None:
         """Adjust the detail panel height to fit the current terminal size."""
-        panel = self.query_one(DetailPanel)
-        panel.styles.height = DetailPanel.height_for_terminal(self.size.height)
+        self._panel.styles.height = DetailPanel.height_for_terminal(self.size.height)
 
     def check_action(self, action: str, parameters: tuple) -> bool | None:
         """Disable arrow-key actions when a text input modal is open."""
@@ -447,25 +720,71 @@ class IndicoApp(App):
 
     def watch_theme(self, old_value: str, new_value: str) -> None:
         """Re-render the table when the theme changes so colors update."""
+        self._accent_hex_cached = None
+        # Only the accent color is theme-dependent in the table; skip if it's unchanged
+        if self._accent_hex == self._last_rendered_accent:
+            return
         if self._view_mode == ViewMode.FAVORITES:
             self._restore_favorites_view()
-        elif self._category_id and self._category_id in self._category_events_cache:
-            self._populate_category_table(
-                self._category_events_cache[self._category_id],
-                self._category_name,
-            )
+        elif self._category_id:
+            events = self._category_events_cache.lookup(self._category_id)
+            if events is not None:
+                self._populate_category_table(events, self._category_name)
 
     def _load_events(self) -> None:
-        status = self.query_one(StatusBar)
-        status.update("Loading events...")
+        self._set_status("Loading events...")
         try:
-            self.events = get_favorite_events()
+            self.events = get_favorite_events(on_refresh=self._on_favorites_refreshed)
         except Exception as e:
-            status.update(f"Error: {e}")
+            self._set_status(f"Error: {e}")
             return
 
-        self._timetable_cache = {}
+        self._timetable_cache.clear()
+        self._formatted_timetable_cache.clear()
         self._restore_favorites_view()
+        self._warm_timetables([ev.id for ev in self.events[: self._WARMUP_COUNT]])
+
+    def _on_favorites_refreshed(self, events: list[IndicoEvent]) -> None:
+        """Background refresh of favorites served from a stale cache (API thread)."""
+        if not self._closing:
+            self.call_from_thread(self._show_refreshed_favorites, events)
+
+    def _show_refreshed_favorites(self, events: list[IndicoEvent]) -> None:
+        self.events = events
+        if self._view_mode != ViewMode.FAVORITES:
+            # Popping back to favorites rebuilds from self.events
+            return
+        # Keep the cursor on the same event if it is still there
+        selected = self._selected_event()
+        self._restore_favorites_view()
+        if selected is not None and str(selected.id) in self._row_key_to_event:
+            self._table.move_cursor(row=self._table.get_row_index(str(selected.id)))
+        self._warm_timetables([ev.id for ev in events[: self._WARMUP_COUNT]])
+
+    def _warm_timetables(self, event_ids: list[int]) -> None:
+        """Fetch timetables for `event_ids` in the background, a few at a time.
+
+        Each of the _WARMUP_CONCURRENCY pool tasks works through the shared queue in
+        turn, leaving the rest of the pool free for fetches around the cursor.
+        """
+        # Replacing the queue (on refresh) or clearing it (on unmount) ends old drains
+        self._warmup_queue.clear()
+        queue = self._warmup_queue = deque(event_ids)
+
+        def drain() -> None:
+            while True:
+                try:
+                    event_id = queue.popleft()
+                except IndexError:
+                    return
+                if event_id in self._timetable_cache or event_id in self._timetable_inflight:
+                    continue
+                self._timetable_inflight.add(event_id)
+                # Current generation: warmup is never dropped as stale
+                self._load_timetable(event_id, self._highlight_gen, True)
+
+        for _ in range(min(self._WARMUP_CONCURRENCY, len(queue))):
+            self._timetable_pool.submit(drain)
 
     def _restore_favorites_view(self) -> None:
         """Rebuild the DataTable with cached favorites events."""
@@ -473,32 +792,24 @@ class IndicoApp(App):
         saved_cursor = self._nav_stack[0].cursor_row if self._nav_stack else 0
         self._nav_stack = [NavEntry(ViewMode.FAVORITES, cursor_row=saved_cursor)]
         self.sub_title = ""
-        table = self.query_one(DataTable)
-        self._setup_table_columns(table)
-        self._row_key_to_event = {}
-        self._current_detail_event_id = None
-        self.query_one(DetailPanel).set_message("No event selected")
-
-        accent = Style(color=self._accent_hex)
-        regex = self._compile_regex_filter()
-        prev_date = None
-        shown = 0
-        for ev in self.events:
-            if regex and not (regex.search(ev.title) or regex.search(ev.category)):
-                continue
-            shown += 1
-            date_key = ev.start_dt.strftime("%Y-%m-%d")
-            first_of_day = date_key != prev_date
-            if prev_date is not None and first_of_day:
-                self._add_separator_row(table, f"{self.SEPARATOR_KEY_PREFIX}{date_key}")
-            prev_date = date_key
-            self._add_event_row(table, ev, first_of_day, accent)
+        table = self._table
+        accent_hex = self._accent_hex
+        accent = _accent_style(accent_hex)
+        regex = self._regex_pattern
+        # Coalesce the per-row refreshes into a single repaint
+        with self.batch_update():
+            self._setup_table_columns(table)
+            self._row_key_to_event = {}
+            self._current_detail_event_id = None
+            self._panel.loading = False
+            self._panel.set_message("No event selected")
+            shown = self._emit_event_rows(table, self.events, accent, regex)
+        self._last_rendered_accent = accent_hex
 
-        status = self.query_one(StatusBar)
         if regex:
-            status.update(f"{shown}/{len(self.events)} events matching /{self._regex_filter}/")
+            self._set_status(f"{shown}/{len(self.events)} events matching /{self._regex_filter}/")
         else:
-            status.update(f"Loaded {len(self.events)} events")
+            self._set_status(f"Loaded {len(self.events)} events")
 
         # Restore cursor position
         if saved_cursor > 0:
@@ -510,57 +821,128 @@ class IndicoApp(App):
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         if event.row_key is None:
             return
+        table = self._table
+        row = table.cursor_row
         key = event.row_key.value
-        if key.startswith(self.SEPARATOR_KEY_PREFIX):
-            table = self.query_one(DataTable)
-            row = table.cursor_row
+        # Event rows (the common case) resolve with one dict lookup; only misses
+        # need the prefix test to tell separators from subcategory rows
+        ev = self._row_key_to_event.get(key)
+        if ev is None and key.startswith(self.SEPARATOR_KEY_PREFIX):
             # Skip in the direction we were moving (compare to previous position)
-            prev = getattr(self, "_prev_cursor_row", 0)
-            direction = 1 if row >= prev else -1
+            direction = 1 if row >= self._prev_cursor_row else -1
             target = row + direction
-            if 0 <= target < len(table.ordered_rows):
+            if 0 <= target < table.row_count:
                 table.move_cursor(row=target)
             return
-        self._prev_cursor_row = self.query_one(DataTable).cursor_row
-        ev = self._row_key_to_event.get(key)
+        self._prev_cursor_row = row
         if ev is None:
             return
-        if ev.id == self._current_detail_event_id:
+        event_id = ev.id
+        if event_id == self._current_detail_event_id:
             return
-        self._current_detail_event_id = ev.id
-        panel = self.query_one(DetailPanel)
-        if ev.id in self._timetable_cache:
-            panel.set_contributions(self._timetable_cache[ev.id])
+        self._current_detail_event_id = event_id
+        panel = self._panel
+        contributions = self._timetable_cache.lookup(event_id)
+        if contributions is not None:
+            # An earlier miss may have left the overlay up with nothing left to clear it
+            panel.loading = False
+            panel.set_contributions(
+                contributions, self._accent, event_id,
+                self._formatted_timetable_cache.lookup(event_id),
+            )
         else:
             panel.loading = True
-            self._fetch_timetable(ev.id)
+        # Hold off network requests until the cursor stops moving
+        if self._highlight_timer is not None:
+            self._highlight_timer.stop()
+        self._highlight_timer = self.set_timer(
+            self._HIGHLIGHT_DEBOUNCE, self._on_highlight_settled
+        )
+
+    def _on_highlight_settled(self) -> None:
+        """Fetch the highlighted event's timetable and prefetch the next ones."""
+        self._highlight_timer = None
+        self._highlight_gen += 1
+        gen = self._highlight_gen
+        event_id = self._current_detail_event_id
+        inflight = self._timetable_inflight
+        # An in-flight prefetch will fill the panel when it lands
+        if (
+            event_id is not None
+            and event_id not in self._timetable_cache
+            and event_id not in inflight
+        ):
+            inflight.add(event_id)
+            self._timetable_pool.submit(self._load_timetable, event_id, gen)
+        self._prefetch_timetables(self._table.cursor_row, gen)
+
+    def _prefetch_timetables(self, row: int, gen: int) -> None:
+        """Queue background timetable fetches for the events just below and above `row`."""
+        keys = self._ordered_row_keys
+        row_map = self._row_key_to_event
+        tt_cache = self._timetable_cache
+        inflight = self._timetable_inflight
+        submit = self._timetable_pool.submit
+        # Ahead first: that's the direction users usually scroll
+        for step, remaining in ((1, self._PREFETCH_AHEAD), (-1, self._PREFETCH_BEHIND)):
+            i = row + step
+            while remaining and 0 <= i < len(keys):
+                ev = row_map.get(keys[i])
+                i += step
+                if ev is None:
+                    continue
+                remaining -= 1
+                if ev.id not in tt_cache and ev.id not in inflight:
+                    inflight.add(ev.id)
+                    submit(self._load_timetable, ev.id, gen, True)
+
+    def _load_timetable(self, event_id: int, gen: int, prefetch: bool = False) -> None:
+        """Fetch and cache a timetable (pool thread); show it if its event is selected.
 
-    @work(exclusive=True, group="timetable", thread=True)
-    def _fetch_timetable(self, event_id: int) -> None:
+        Prefetches queued for an earlier cursor position (`gen` is stale) are dropped
+        unless their event has since become the selected one.
+        """
+        if (
+            prefetch
+            and gen != self._highlight_gen
+            and self._current_detail_event_id != event_id
+        ):
+            self._timetable_inflight.discard(event_id)
+            return
         try:
             contributions = get_timetable(event_id)
         except Exception as e:
+            if self._closing or (prefetch and self._current_detail_event_id != event_id):
+                # Nobody is waiting; leave it uncached so landing on the row retries
+                self._timetable_inflight.discard(event_id)
+                return
             contributions = []
             self.call_from_thread(
-                self.query_one(StatusBar).update, f"Timetable error: {e}"
+                self._set_status, f"Timetable error: {e}"
             )
-        self._timetable_cache[event_id] = contributions
+        if self._closing:
+            # The app is gone; there is no UI left to call back into
+            return
+        # Build the panel's first options here rather than on the UI thread
+        prerendered = DetailPanel.prerender(contributions, self._accent)
+        self._formatted_timetable_cache.put(event_id, prerendered)
+        self._timetable_cache.put(event_id, contributions)
+        self._timetable_inflight.discard(event_id)
         if self._current_detail_event_id == event_id:
-            self.call_from_thread(self._set_panel_contributions, contributions)
-        else:
-            self.call_from_thread(self._set_panel_loading, False)
+            self.call_from_thread(
+                self._set_panel_contributions, event_id, contributions, prerendered
+            )
 
-    def _set_panel_contributions(self, contributions: list[Contribution]) -> None:
-        panel = self.query_one(DetailPanel)
+    def _set_panel_contributions(
+        self, event_id: int, contributions: list[Contribution], prerendered: tuple | None = None,
+    ) -> None:
+        panel = self._panel
         panel.loading = False
-        panel.set_contributions(contributions)
+        panel.set_contributions(contributions, self._accent, event_id, prerendered)
 
     def _selected_event(self) -> IndicoEvent | None:
-        table = self.query_one(DataTable)
-        if table.cursor_row is None:
-            return None
-        row_key = table.ordered_rows[table.cursor_row].key.value
-        return self._row_key_to_event.get(row_key)
+        row_key = self._row_key_at(self._table.cursor_row)
+        return self._row_key_to_event.get(row_key) if row_key is not None else None
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         ev = self._row_key_to_event.get(event.row_key.value)
@@ -569,31 +951,30 @@ class IndicoApp(App):
 
     # -- Actions --------------------------------------------------------
 
-    def _save_cursor(self) -> None:
-        """Save the current cursor row into the top nav entry."""
-        table = self.query_one(DataTable)
-        self._current_nav.cursor_row = table.cursor_row or 0
-
     def _pop_to_previous_view(self) -> None:
         """Restore the view from the current top of the nav stack after a pop."""
         saved_cursor = self._current_nav.cursor_row
         if self._view_mode == ViewMode.FAVORITES:
             self._restore_favorites_view()
         else:
-            cat_id = self._category_id
-            if cat_id in self._category_events_cache:
-                self._populate_category_table(
-                    self._category_events_cache[cat_id], self._category_name
-                )
+            events = self._category_events_cache.lookup(self._category_id)
+            if events is not None:
+                self._populate_category_table(events, self._category_name)
                 try:
-                    self.query_one(DataTable).move_cursor(row=saved_cursor)
+                    self._table.move_cursor(row=saved_cursor)
                 except (IndexError, KeyError):
                     pass
 
+    def _abort_navigation(self) -> None:
+        """Drop the nav entry whose load failed and go back to the view beneath it."""
+        if len(self._nav_stack) > 1:
+            self._nav_stack.pop()
+        self._pop_to_previous_view()
+
     def _push_category(self, category_id: int, category_name: str, focus_event_id: int = 0) -> None:
         """Save cursor, push a new category onto the nav stack, and load it."""
-        self._save_cursor()
-        self._regex_filter = ""
+        self._current_nav.cursor_row = self._table.cursor_row or 0
+        self._set_regex_filter("")
         self._nav_stack.append(NavEntry(ViewMode.CATEGORY, category_id, category_name))
         self._load_category_events(category_id, category_name, focus_event_id)
 
@@ -605,7 +986,7 @@ class IndicoApp(App):
         if self._view_mode == ViewMode.FAVORITES:
             ev = self._selected_event()
             if ev is None or ev.category_id == 0:
-                self.query_one(StatusBar).update("No category for this event")
+                self._set_status("No category for this event")
                 return
             # Go to the event's own category
             self._push_category(ev.category_id, ev.category, ev.id)
@@ -615,15 +996,14 @@ class IndicoApp(App):
     @work(exclusive=True, group="cat_info", thread=True)
     def _navigate_to_parent_of(self, category_id: int, category_name: str, focus_event_id: int = 0) -> None:
         """Fetch category info and navigate to its parent."""
-        status = self.query_one(StatusBar)
-        self.call_from_thread(status.update, "Loading parent category...")
+        self.call_from_thread(self._set_status, "Loading parent category...")
         self.call_from_thread(self._set_table_loading, True)
         self.call_from_thread(self._set_panel_loading, True)
 
         def _restore() -> None:
             self.call_from_thread(self._set_table_loading, False)
             self.call_from_thread(self._set_panel_loading, False)
-            self.call_from_thread(status.update, "")
+            self.call_from_thread(self._set_status, "")
 
         try:
             info = self._fetch_category_info(category_id)
@@ -654,10 +1034,10 @@ class IndicoApp(App):
 
     def _fetch_category_info(self, category_id: int) -> dict:
         """Get category info, using cache if available."""
-        if category_id in self._category_info_cache:
-            return self._category_info_cache[category_id]
-        info = get_category_info(category_id)
-        self._category_info_cache[category_id] = info
+        info = self._category_info_cache.lookup(category_id)
+        if info is None:
+            info = get_category_info(category_id)
+            self._category_info_cache.put(category_id, info)
         return info
 
     def action_open(self) -> None:
@@ -668,13 +1048,12 @@ class IndicoApp(App):
         if isinstance(self.screen, AttachmentPicker):
             self.screen.select_highlighted()
             return
-        if self.query_one(DetailPanel).has_focus:
+        if self._panel.has_focus:
             self.action_open_material()
             return
-        table = self.query_one(DataTable)
-        if table.cursor_row is None:
+        row_key = self._row_key_at(self._table.cursor_row)
+        if row_key is None:
             return
-        row_key = table.ordered_rows[table.cursor_row].key.value
         # Check if it's a subcategory row
         if row_key.startswith(self.SUBCAT_KEY_PREFIX):
             subcat_id = int(row_key[len(self.SUBCAT_KEY_PREFIX):])
@@ -687,67 +1066,120 @@ class IndicoApp(App):
             self._open_url(ev.url)
 
     def _set_table_loading(self, loading: bool) -> None:
-        self.query_one(DataTable).loading = loading
+        self._table.loading = loading
 
     def _set_panel_loading(self, loading: bool) -> None:
-        self.query_one(DetailPanel).loading = loading
+        self._panel.loading = loading
 
     @work(exclusive=True, group="load_view", thread=True)
     def _load_category_events(
         self, category_id: int, category_name: str, focus_event_id: int = 0
     ) -> None:
         self.call_from_thread(
-            self.query_one(StatusBar).update, f"Loading category '{_escape_rich(category_name)}'..."
+            self._set_status, f"Loading category '{_escape_rich(category_name)}'..."
         )
         self.call_from_thread(self._set_table_loading, True)
 
-        if category_id in self._category_events_cache:
-            events = self._category_events_cache[category_id]
-        else:
+        # Category info is needed before rendering; fetch it while the events load
+        info_future = _io_pool.submit(self._fetch_category_info, category_id)
+        events = self._category_events_cache.lookup(category_id)
+        if events is None:
             try:
-                events = get_category_events(category_id)
+                events = category_fetcher.fetch(category_id).result()
             except Exception as e:
                 self.call_from_thread(self._set_table_loading, False)
                 # Pop the failed nav entry and stay where we were
-                if len(self._nav_stack) > 1:
-                    self._nav_stack.pop()
-                self.call_from_thread(self._pop_to_previous_view)
+                self.call_from_thread(self._abort_navigation)
                 self.call_from_thread(
                     self.notify,
                     f"Cannot access category: {e}",
                     severity="error",
                 )
                 return
-            self._category_events_cache[category_id] = events
+            self._category_events_cache.put(category_id, events)
+
+        # Give the info a moment so the table is usually built once, subcategories included,
+        # but don't hold back events that are already here on a slow info request.
+        # Without events, wait: a 403 on the info is what tells a restricted category apart
+        info_error = None
+        info_late = False
+        try:
+            info_future.result(timeout=self._INFO_WAIT if events else None)
+        except TimeoutError:
+            info_late = True
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 403 and not events:
+                # Export API returned empty + info returned 403 → restricted
+                self.call_from_thread(self._set_table_loading, False)
+                self.call_from_thread(self._abort_navigation)
+                self.call_from_thread(
+                    self.notify,
+                    f"Access denied to category '{category_name}'",
+                    severity="error",
+                )
+                return
+        except Exception as e:
+            info_error = e
 
-        # Show table immediately (without subcategories if info not cached yet)
         self.call_from_thread(
             self._populate_category_table, events, category_name, focus_event_id
         )
-
-        # Then fetch category info and re-render if subcategories were found
-        if category_id not in self._category_info_cache:
+        if info_late:
             try:
-                info = self._fetch_category_info(category_id)
-                if info.get("subcategories"):
-                    self.call_from_thread(
-                        self._populate_category_table, events, category_name, focus_event_id
-                    )
-            except requests.HTTPError as e:
-                if e.response is not None and e.response.status_code == 403 and not events:
-                    # Export API returned empty + info returned 403 → restricted
-                    if len(self._nav_stack) > 1:
-                        self._nav_stack.pop()
-                    self.call_from_thread(self._pop_to_previous_view)
-                    self.call_from_thread(
-                        self.notify,
-                        f"Access denied to category '{category_name}'",
-                        severity="error",
-                    )
+                info = info_future.result()
+            except requests.HTTPError:
+                return
             except Exception as e:
-                self.call_from_thread(
-                    self.query_one(StatusBar).update, f"Category info error: {e}"
-                )
+                info_error = e
+            else:
+                if info.get("subcategories"):
+                    self.call_from_thread(self._show_late_subcategories, category_id)
+        if info_error is not None:
+            self.call_from_thread(
+                self._set_status, f"Category info error: {info_error}"
+            )
+
+    def _show_late_subcategories(self, category_id: int) -> None:
+        """Rebuild the category table once its info (subcategories) has arrived."""
+        if self._view_mode != ViewMode.CATEGORY or self._category_id != category_id:
+            return
+        events = self._category_events_cache.lookup(category_id)
+        if events is None:
+            return
+        selected = self._selected_event()
+        self._populate_category_table(
+            events, self._category_name, selected.id if selected is not None else 0
+        )
+
+    def _add_category_rows(
+        self,
+        table: DataTable,
+        events: list[IndicoEvent],
+        subcats: list[dict],
+        accent_hex: str,
+        regex: re.Pattern | None,
+    ) -> int:
+        """Add subcategory rows, a separator and the event rows; returns events shown."""
+        if regex is not None:
+            subcats = [sub for sub in subcats if regex.search(sub["title"])]
+        subcat_style = _accent_style(accent_hex, bold=True)
+        for sub in subcats:
+            subcat_key = f"{self.SUBCAT_KEY_PREFIX}{sub['id']}"
+            table.add_row(
+                _EMPTY_TEXT,
+                _EMPTY_TEXT,
+                self._SUBCAT_ARROW,
+                Text(sub["title"][:TITLE_WIDTH], style=subcat_style),
+                self._SUBCAT_LABEL,
+                key=subcat_key,
+            )
+            self._ordered_row_keys.append(subcat_key)
+
+        # Add separator between subcategories and events
+        if subcats:
+            self._add_separator_row(table, f"{self.SEPARATOR_KEY_PREFIX}subcats")
+
+        return self._emit_event_rows(table, events, _accent_style(accent_hex), regex)
 
     def _populate_category_table(
         self,
@@ -756,11 +1188,11 @@ class IndicoApp(App):
         focus_event_id: int = 0,
     ) -> None:
         """Rebuild DataTable for category view with subcategories and events."""
-        self.query_one(DataTable).loading = False
-        self.query_one(DetailPanel).loading = False
+        self._table.loading = False
+        self._panel.loading = False
         self._current_nav.view_mode = ViewMode.CATEGORY
         self.sub_title = f"Category: {_escape_rich(category_name)}"
-        table = self.query_one(DataTable)
+        table = self._table
         self._setup_table_columns(table)
         self._row_key_to_event = {}
         self._subcat_names = {}
@@ -771,71 +1203,57 @@ class IndicoApp(App):
         )
         if not keep_detail:
             self._current_detail_event_id = None
-            self.query_one(DetailPanel).set_message("No event selected")
+            self._panel.set_message("No event selected")
 
-        accent = Style(color=self._accent_hex)
+        accent_hex = self._accent_hex
         cat_id = self._category_id
-        row_index = 0
-        focus_row = 0
 
         # Suppress highlight events during rebuild when preserving detail panel
         prevent = table.prevent(DataTable.RowHighlighted) if keep_detail else nullcontext()
-        regex = self._compile_regex_filter()
-        with prevent:
-            # Add subcategory rows at the top
+        regex = self._regex_pattern
+        # Coalesce the per-row refreshes into a single repaint
+        with self.batch_update(), prevent:
             info = self._category_info_cache.get(cat_id)
             subcats = info.get("subcategories", []) if info else []
-            shown_subcats = False
             for sub in subcats:
-                sub_id = sub["id"]
-                sub_title = sub["title"]
-                self._subcat_names[sub_id] = sub_title
-                if regex and not regex.search(sub_title):
-                    continue
-                shown_subcats = True
-                row_key = f"{self.SUBCAT_KEY_PREFIX}{sub_id}"
-                table.add_row(
-                    Text(""),
-                    Text(""),
-                    Text("  →", style="bold"),
-                    Text(sub_title[:42], style=Style(color=self._accent_hex, bold=True)),
-                    Text("subcategory", style=DIM_ITALIC),
-                    key=row_key,
-                )
-                row_index += 1
+                self._subcat_names[sub["id"]] = sub["title"]
+            # Unfiltered views of a category are replayed from the rows built last time
+            prebuilt = self._category_rows_cache.lookup(cat_id) if regex is None else None
+            if (
+                prebuilt is not None
+                and prebuilt[0] is events
+                and prebuilt[1] is info
+                and prebuilt[2] == accent_hex
+            ):
+                rows = prebuilt[3]
+                add_row = table.add_row
+                for cells, key in rows:
+                    add_row(*cells, key=key)
+                self._ordered_row_keys = [key for _cells, key in rows]
+                self._row_key_to_event = dict(prebuilt[4])
+                shown = len(events)
+            else:
+                shown = self._add_category_rows(table, events, subcats, accent_hex, regex)
+                if regex is None:
+                    rows = [(tuple(table.get_row(key)), key) for key in self._ordered_row_keys]
+                    self._category_rows_cache.put(
+                        cat_id, (events, info, accent_hex, rows, dict(self._row_key_to_event))
+                    )
+        self._last_rendered_accent = accent_hex
 
-            # Add separator between subcategories and events
-            if shown_subcats:
-                self._add_separator_row(table, f"{self.SEPARATOR_KEY_PREFIX}subcats")
-                row_index += 1
+        # The table maps row keys to indices, so no need to count rows while emitting
+        focus_key = str(focus_event_id)
+        if focus_event_id and focus_key in self._row_key_to_event:
+            focus_row = table.get_row_index(focus_key)
+            if focus_row > 0:
+                table.move_cursor(row=focus_row)
 
-            prev_date = None
-            shown = 0
-            for ev in events:
-                if regex and not (regex.search(ev.title) or regex.search(ev.category)):
-                    continue
-                shown += 1
-                date_key = ev.start_dt.strftime("%Y-%m-%d")
-                first_of_day = date_key != prev_date
-                if prev_date is not None and first_of_day:
-                    self._add_separator_row(table, f"{self.SEPARATOR_KEY_PREFIX}{date_key}")
-                    row_index += 1
-                prev_date = date_key
-                self._add_event_row(table, ev, first_of_day, accent)
-                if ev.id == focus_event_id:
-                    focus_row = row_index
-                row_index += 1
-
-        if focus_row > 0:
-            table.move_cursor(row=focus_row)
-
-        status = self.query_one(StatusBar)
         if regex:
-            status.update(
+            self._set_status(
                 f"{shown}/{len(events)} events matching /{self._regex_filter}/ in '{_escape_rich(category_name)}'"
             )
         else:
-            status.update(
+            self._set_status(
                 f"{len(events)} events in '{_escape_rich(category_name)}'"
             )
 
@@ -845,35 +1263,39 @@ class IndicoApp(App):
             return
         if self._view_mode == ViewMode.FAVORITES:
             return
-        self._regex_filter = ""
+        self._set_regex_filter("")
         self._restore_favorites_view()
 
     def action_sync_calendar(self) -> None:
-        status = self.query_one(StatusBar)
         event = self._selected_event()
         if not event:
-            status.update("No event selected")
+            self._set_status("No event selected")
             return
+        self._export_to_calendar(event)
+
+    @work(group="calendar", thread=True)
+    def _export_to_calendar(self, event: IndicoEvent) -> None:
+        """Write the .ics and wait for `open` on a worker so the UI stays responsive."""
         try:
             path = open_in_calendar(event)
-            status.update(f"Opened {path.name} in Calendar")
+            message = f"Opened {path.name} in Calendar"
         except Exception as e:
-            status.update(f"Calendar sync error: {e}")
+            message = f"Calendar sync error: {e}"
+        self.call_from_thread(self._set_status, message)
 
     def action_update_url(self) -> None:
-        status = self.query_one(StatusBar)
         event = self._selected_event()
         if not event:
-            status.update("No event selected")
+            self._set_status("No event selected")
             return
         self._update_url_event = event
         try:
             candidates = find_calendar_events(event)
         except Exception as e:
-            status.update(f"URL update error: {e}")
+            self._set_status(f"URL update error: {e}")
             return
         if not candidates:
-            status.update("No calendar events found")
+            self._set_status("No calendar events found")
             return
         self.push_screen(
             CalendarEventPicker(candidates, event.start_dt),
@@ -881,38 +1303,33 @@ class IndicoApp(App):
         )
 
     def _on_calendar_event_picked(self, result: tuple | None) -> None:
-        status = self.query_one(StatusBar)
         if result is None:
-            status.update("Cancelled")
+            self._set_status("Cancelled")
             return
         event_id, start_ts = result
         event = self._update_url_event
         try:
             ok = set_event_url(event_id, start_ts, event.url)
             if ok:
-                status.update("Updated calendar event URL")
+                self._set_status("Updated calendar event URL")
             else:
-                status.update("Failed to update calendar event")
+                self._set_status("Failed to update calendar event")
         except Exception as e:
-            status.update(f"URL update error: {e}")
+            self._set_status(f"URL update error: {e}")
 
     def action_toggle_focus(self) -> None:
         """Toggle focus between DataTable and the detail panel OptionList."""
-        table = self.query_one(DataTable)
-        panel = self.query_one(DetailPanel)
+        table = self._table
+        panel = self._panel
         if table.has_focus:
             panel.focus()
         else:
             table.focus()
 
-    def _compile_regex_filter(self) -> re.Pattern | None:
-        """Compile the current regex filter, returning None if empty or invalid."""
-        if not self._regex_filter:
-            return None
-        try:
-            return re.compile(self._regex_filter, re.IGNORECASE)
-        except re.error:
-            return None
+    def _set_regex_filter(self, pattern: str) -> None:
+        """Set the filter, compiling it once; raises re.error if it is invalid."""
+        self._regex_pattern = re.compile(pattern, re.IGNORECASE) if pattern else None
+        self._regex_filter = pattern
 
     def action_regex_filter(self) -> None:
         self.push_screen(
@@ -923,32 +1340,27 @@ class IndicoApp(App):
     def _on_regex_entered(self, result: str | None) -> None:
         if result is None:
             return
-        # Validate regex before applying
-        if result:
-            try:
-                re.compile(result)
-            except re.error as e:
-                self.query_one(StatusBar).update(f"Invalid regex: {e}")
-                return
-        self._regex_filter = result
+        try:
+            self._set_regex_filter(result)
+        except re.error as e:
+            self._set_status(f"Invalid regex: {e}")
+            return
         if self._view_mode == ViewMode.FAVORITES:
             self._restore_favorites_view()
-        elif self._category_id and self._category_id in self._category_events_cache:
-            self._populate_category_table(
-                self._category_events_cache[self._category_id],
-                self._category_name,
-            )
+        elif self._category_id:
+            events = self._category_events_cache.lookup(self._category_id)
+            if events is not None:
+                self._populate_category_table(events, self._category_name)
 
     def action_open_material(self) -> None:
         """Open attachments for the selected contribution."""
-        status = self.query_one(StatusBar)
-        panel = self.query_one(DetailPanel)
+        panel = self._panel
         contrib = panel.selected_contribution()
         if contrib is None:
-            status.update("No contribution selected")
+            self._set_status("No contribution selected")
             return
         if not contrib.attachments:
-            status.update("No attachments")
+            self._set_status("No attachments")
             return
         if len(contrib.attachments) == 1:
             _title, url = contrib.attachments[0]